@@ -29,6 +29,21 @@ async def test_many_messages_one_event() -> None:
         assert set(received) == set(messages)
 
 
+@pytest.mark.parametrize('max_polls', [None, 1, 2])
+async def test_max_polls(max_polls: int | None) -> None:
+    received: list[str] = []
+    e1 = walnats.Event(get_random_name(), str)
+    e2 = walnats.Event(get_random_name(), str)
+    await run_burst(
+        walnats.Actor(get_random_name(), e1, received.append),
+        walnats.Actor(get_random_name(), e2, received.append),
+        messages=[(e1, 'hi'), (e2, 'bye')],
+        max_polls=max_polls,
+        poll_delay=.1,
+    )
+    assert sorted(received) == ['bye', 'hi']
+
+
 async def test_respect_timeout() -> None:
     async def handler(e: str) -> None:
         raise AssertionError('unreachable')
@@ -42,6 +57,25 @@ async def test_respect_timeout() -> None:
         )
 
 
+@pytest.mark.parametrize('job_timeout', [None, .05])
+async def test_job_timeout(job_timeout: float | None) -> None:
+    received = []
+
+    async def handler(e: str) -> None:
+        await asyncio.sleep(.1)
+        received.append(e)
+
+    e = walnats.Event(get_random_name(), str)
+    await run_burst(
+        walnats.Actor(get_random_name(), e, handler, job_timeout=job_timeout),
+        messages=[(e, 'hi')],
+    )
+    if job_timeout is None:
+        assert received == ['hi']
+    else:
+        assert received == []
+
+
 def slow_handler(e: str) -> None:
     time.sleep(.1)
 
@@ -159,6 +193,69 @@ async def test_pulse(pulse: bool) -> None:
             assert len(received) == 2
 
 
+async def test_cancel__waits_for_workers() -> None:
+    failed: list[object] = []
+
+    class Middleware(walnats.middlewares.Middleware):
+        def on_failure(self, ctx: walnats.types.ErrorContext) -> None:
+            failed.append(ctx.message)
+
+    async def handler(e: str) -> None:
+        try:
+            await asyncio.sleep(10)
+        finally:
+            # cleanup that takes a while after the handler is cancelled
+            await asyncio.sleep(.05)
+
+    e = walnats.Event(get_random_name(), str)
+    a = walnats.Actor(get_random_name(), e, handler, middlewares=(Middleware(),))
+    events = walnats.Events(e)
+    actors = walnats.Actors(a)
+    async with events.connect() as pub_conn, actors.connect() as sub_conn:
+        await pub_conn.register()
+        await sub_conn.register()
+        await pub_conn.emit(e, 'hi')
+        await asyncio.sleep(.01)
+        task = asyncio.create_task(sub_conn.listen())
+        await asyncio.sleep(.1)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        # the interrupted message is nak'ed before listen returns
+        assert failed == ['hi']
+
+
+async def test_cancel__stops_hooks() -> None:
+    log: list[str] = []
+
+    class Middleware(walnats.middlewares.Middleware):
+        async def on_failure(self, ctx: walnats.types.ErrorContext) -> None:
+            log.append('hook started')
+            await asyncio.sleep(.05)
+            log.append('hook finished')
+
+    async def handler(e: str) -> None:
+        await asyncio.sleep(10)
+
+    e = walnats.Event(get_random_name(), str)
+    a = walnats.Actor(get_random_name(), e, handler, middlewares=(Middleware(),))
+    events = walnats.Events(e)
+    actors = walnats.Actors(a)
+    async with events.connect() as pub_conn, actors.connect() as sub_conn:
+        await pub_conn.register()
+        await sub_conn.register()
+        await pub_conn.emit(e, 'hi')
+        await asyncio.sleep(.01)
+        task = asyncio.create_task(sub_conn.listen())
+        await asyncio.sleep(.1)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        log.append('listen returned')
+        await asyncio.sleep(.1)
+    assert log == ['hook started', 'listen returned']
+
+
 async def test_with_response_but_regular_emit() -> None:
     """
     If an actor is subscribed to an event with a response,
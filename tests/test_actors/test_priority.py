@@ -6,7 +6,7 @@ import random
 import hypothesis
 from hypothesis import strategies
 
-from walnats._actors._priority import Priority
+from walnats._actors._priority import Priority, PrioritySemaphore
 
 
 @hypothesis.given(
@@ -26,10 +26,16 @@ async def test_priority_one_batch(sem_value, job_count):
             await asyncio.sleep(0)
 
     tasks = []
-    sem = asyncio.BoundedSemaphore(sem_value)
+    sem = PrioritySemaphore(sem_value)
+    # occupy all slots, so that all workers have to wait
+    for _ in range(sem_value):
+        await sem.acquire(0)
     for _ in range(job_count):
         prio = random.choice(list(Priority))
-        tasks.append(worker(sem, prio))
+        tasks.append(asyncio.create_task(worker(sem, prio)))
+    await asyncio.sleep(0)
+    for _ in range(sem_value):
+        sem.release()
     await asyncio.gather(*tasks)
 
     assert len(results) == job_count
@@ -55,12 +61,16 @@ async def test_priority_multiple_batches(sem_value, job_count, group_count):
             await asyncio.sleep(.0001)
 
     tasks = []
-    sem = asyncio.BoundedSemaphore(sem_value)
+    sem = PrioritySemaphore(sem_value)
+    for _ in range(sem_value):
+        await sem.acquire(0)
     for group in range(group_count):
         for _ in range(job_count):
             prio = random.choice(list(Priority))
-            tasks.append(worker(sem, prio, group))
+            tasks.append(asyncio.create_task(worker(sem, prio, group)))
         await asyncio.sleep(.0015)
+    for _ in range(sem_value):
+        sem.release()
     await asyncio.gather(*tasks)
 
     assert len(results) == job_count * group_count
@@ -69,3 +79,87 @@ async def test_priority_multiple_batches(sem_value, job_count, group_count):
             if g1 != group or g2 != group:
                 continue
             assert p1.value <= p2.value
+
+
+async def test_priority_semaphore_fifo():
+    """Waiters with the same priority are woken up in the order they came.
+    """
+    results = []
+
+    async def worker(sem: PrioritySemaphore, prio: int, idx: int):
+        await sem.acquire(prio)
+        results.append((prio, idx))
+        sem.release()
+
+    sem = PrioritySemaphore(1)
+    await sem.acquire(0)
+    tasks = [
+        asyncio.create_task(worker(sem, prio, idx))
+        for idx, prio in enumerate([2, 1, 2, 0, 1, 2])
+    ]
+    await asyncio.sleep(0)
+    sem.release()
+    await asyncio.gather(*tasks)
+    assert results == [(0, 3), (1, 1), (1, 4), (2, 0), (2, 2), (2, 5)]
+    assert not sem.locked()
+
+
+async def test_priority_semaphore_cancel():
+    """Cancelled waiters don't take the slot.
+    """
+    sem = PrioritySemaphore(1)
+    await sem.acquire(0)
+    cancelled = asyncio.create_task(sem.acquire(0))
+    waiting = asyncio.create_task(sem.acquire(1))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    await asyncio.sleep(0)
+    sem.release()
+    await asyncio.wait_for(waiting, timeout=1)
+    assert sem.locked()
+    sem.release()
+    assert not sem.locked()
+
+
+async def test_priority_semaphore_release_many():
+    """Releasing many slots wakes up as many waiters in the same loop iteration.
+    """
+    sem = PrioritySemaphore(3)
+    for _ in range(3):
+        await sem.acquire()
+    started = []
+
+    async def worker(idx: int):
+        async with sem:
+            started.append(idx)
+            await asyncio.sleep(1)
+
+    tasks = [asyncio.create_task(worker(idx)) for idx in range(5)]
+    await asyncio.sleep(0)
+    for _ in range(3):
+        sem.release()
+    await asyncio.sleep(0)
+    assert started == [0, 1, 2]
+    assert sem.locked()
+    for task in tasks:
+        task.cancel()
+
+
+async def test_priority_semaphore_wait_available():
+    """Waiting for a free slot doesn't take the slot.
+    """
+    sem = PrioritySemaphore(1)
+    await sem.wait_available()
+    assert not sem.locked()
+
+    await sem.acquire()
+    probe = asyncio.create_task(sem.wait_available(1))
+    waiter = asyncio.create_task(sem.acquire(2))
+    await asyncio.sleep(0)
+    assert not probe.done()
+    sem.release()
+    await asyncio.wait_for(probe, timeout=1)
+    await asyncio.wait_for(waiter, timeout=1)
+    assert sem.locked()
+    sem.release()
+    assert not sem.locked()
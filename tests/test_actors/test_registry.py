@@ -24,6 +24,21 @@ def test_actors_get():
     assert actors.get('something') is None
 
 
+def test_actors_get__same_name():
+    async def noop(_):
+        pass
+
+    e1 = walnats.Event(get_random_name(), str)
+    e2 = walnats.Event(get_random_name(), str)
+    actors = walnats.Actors(
+        walnats.Actor('a', e1, noop),
+        walnats.Actor('a', e2, noop),
+    )
+    a = actors.get('a')
+    assert a
+    assert a.event is e1
+
+
 def test_actors_iter():
     async def noop(_):
         pass
@@ -3,6 +3,8 @@ from __future__ import annotations
 import asyncio
 from datetime import datetime
 
+import pytest
+
 import walnats
 
 from ..helpers import get_random_name
@@ -27,3 +29,48 @@ async def test_clock() -> None:
         await asyncio.sleep(.01)
         await sub_conn.listen(burst=True)
     assert len(received) == 1
+
+
+async def test_clock__deduplicate() -> None:
+    received: list[datetime] = []
+    event = walnats.Event(get_random_name(), datetime)
+    clock1 = walnats.Clock(event, period=1)
+    clock2 = walnats.Clock(event, period=1)
+    actor = walnats.Actor(get_random_name(), event, received.append)
+    events_reg = walnats.Events(event)
+    actors_reg = walnats.Actors(actor)
+
+    async with events_reg.connect() as pub_conn, actors_reg.connect() as sub_conn:
+        await pub_conn.register()
+        await sub_conn.register()
+        await asyncio.gather(
+            clock1.run(pub_conn, burst=True),
+            clock2.run(pub_conn, burst=True),
+        )
+        await asyncio.sleep(.01)
+        await sub_conn.listen(burst=True, batch=2)
+    assert len(received) == 1
+
+
+async def test_clock_wait__after_last_tick(monkeypatch: pytest.MonkeyPatch) -> None:
+    # the time didn't move past the boundary, but the tick must
+    now = 1000.9995
+
+    async def sleep(delay: float) -> None:
+        nonlocal now
+        now += delay
+
+    monkeypatch.setattr(asyncio, 'sleep', sleep)
+    clock = walnats.Clock(period=1, _now=lambda: datetime.fromtimestamp(now))
+    assert await clock._wait(1001) == 1002
+    assert now >= 1002
+
+
+async def test_clock_wait__woke_up_early() -> None:
+    timestamps = iter([1000.9995, 1000.9999, 1001.0005])
+    clock = walnats.Clock(
+        period=1,
+        _now=lambda: datetime.fromtimestamp(next(timestamps)),
+    )
+    assert await clock._wait() == 1001
+    assert list(timestamps) == []
@@ -33,3 +33,21 @@ async def test_CloudEvent_as_headers__with_time():
         'ce-specversion': '1.0',
         'ce-time': '2023-12-31T23:59:54Z',
     }
+
+
+async def test_CloudEvent_as_dict():
+    ce = walnats.CloudEvent(
+        id='hi123',
+        source='/sensors/tn-123/alerts',
+        type='com.example.object.delete.v2',
+        time=datetime(2023, 12, 31, 23, 59, 54),
+        sampledrate=10,
+    )
+    assert ce.as_dict() == {
+        'id': 'hi123',
+        'source': '/sensors/tn-123/alerts',
+        'type': 'com.example.object.delete.v2',
+        'specversion': '1.0',
+        'time': '2023-12-31T23:59:54Z',
+        'sampledrate': 10,
+    }
@@ -4,6 +4,7 @@ import asyncio
 import logging
 from typing import TYPE_CHECKING, Any
 
+import nats.errors
 import pytest
 
 import walnats
@@ -115,6 +116,49 @@ async def test_emit_sync(event: walnats.Event, caplog: LogCaptureFixture) -> Non
         assert len(caplog.records) == 1
 
 
+@pytest.mark.parametrize('sync', [True, False])
+async def test_emit_many(event: walnats.Event, sync: bool) -> None:
+    received: list[str] = []
+    actor = walnats.Actor(get_random_name(), event, received.append)
+    actors = walnats.Actors(actor)
+    events = walnats.Events(event)
+    async with events.connect() as econ, actors.connect() as acon:
+        await econ.register()
+        await acon.register()
+        await econ.emit_many(event, ['a', 'b', 'c'], sync=sync)
+        await acon.listen(burst=True, batch=3)
+    assert sorted(received) == ['a', 'b', 'c']
+
+
+async def test_emit__same_name() -> None:
+    name = get_random_name()
+    e1 = walnats.Event(name, str)
+    e2 = walnats.Event(name, int)
+    async with walnats.Events(e1, e2).connect() as conn:
+        await conn.emit(e1, 'hi')
+        await conn.emit(e2, 13)
+        with pytest.raises(AssertionError):
+            await conn.emit(walnats.Event(name, float), 1.5)
+
+
+async def test_emit_many__sync_in_batches(
+    event: walnats.Event,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(walnats._events._connection, 'MAX_PENDING_ACKS', 2)
+    received: list[str] = []
+    actor = walnats.Actor(get_random_name(), event, received.append)
+    actors = walnats.Actors(actor)
+    events = walnats.Events(event)
+    messages = ['a', 'b', 'c', 'd', 'e']
+    async with events.connect() as econ, actors.connect() as acon:
+        await econ.register()
+        await acon.register()
+        await econ.emit_many(event, messages, sync=True)
+        await acon.listen(burst=True, batch=len(messages))
+    assert sorted(received) == messages
+
+
 @pytest.mark.parametrize('create', [True, False])
 @pytest.mark.parametrize('update', [True, False])
 async def test_register__twice_same_event(create, update):
@@ -189,3 +233,26 @@ async def test_register__negative_limit():
     async with events.connect() as conn:
         with pytest.raises(walnats.StreamConfigError):
             await conn.register()
+
+
+async def test_request__many() -> None:
+    event = walnats.Event(get_random_name(), str).with_response(int)
+    actor = walnats.Actor(get_random_name(), event, int)
+    actors = walnats.Actors(actor)
+    events = walnats.Events(event)
+    async with events.connect() as econ, actors.connect() as acon:
+        await econ.register()
+        await acon.register()
+        task = asyncio.create_task(acon.listen(burst=True, batch=3))
+        resps = await asyncio.gather(*[econ.request(event, str(i)) for i in range(3)])
+        await task
+    assert resps == [0, 1, 2]
+
+
+async def test_request__timeout() -> None:
+    event = walnats.Event(get_random_name(), str).with_response(int)
+    events = walnats.Events(event)
+    async with events.connect() as conn:
+        await conn.register()
+        with pytest.raises(nats.errors.TimeoutError):
+            await conn.request(event, '42', timeout=.1)
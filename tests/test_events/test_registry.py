@@ -20,6 +20,13 @@ def test_events_get():
     assert events.get('something') is None
 
 
+def test_events_get__same_name():
+    e1 = walnats.Event('e', str)
+    e2 = walnats.Event('e', int)
+    events = walnats.Events(e1, e2)
+    assert events.get('e') is e1
+
+
 def test_events_iter():
     e1 = walnats.Event(get_random_name(), str)
     e2 = walnats.Event(get_random_name(), str)
@@ -158,6 +158,60 @@ async def test_custom_async__on_failure() -> None:
     assert set(triggered) == {'on_start', 'handler', 'on_failure'}
 
 
+async def test_custom_async__many() -> None:
+    triggered = []
+
+    class Middleware1(walnats.middlewares.Middleware):
+        async def on_start(self, ctx: walnats.types.Context) -> None:
+            triggered.append('on_start1')
+
+    class Middleware2(walnats.middlewares.Middleware):
+        async def on_start(self, ctx: walnats.types.Context) -> None:
+            triggered.append('on_start2')
+
+        async def on_success(self, ctx: walnats.types.OkContext) -> None:
+            triggered.append('on_success2')
+
+    async def handler(msg: str) -> None:
+        triggered.append('handler')
+
+    await run_actor(handler, 'hi', Middleware1(), Middleware2())
+    assert len(triggered) == 4
+    assert set(triggered) == {'on_start1', 'on_start2', 'handler', 'on_success2'}
+
+
+async def test_custom_async__one_failed(caplog: LogCaptureFixture) -> None:
+    class Middleware(walnats.middlewares.Middleware):
+        async def on_start(self, ctx: walnats.types.Context) -> None:
+            raise ValueError
+
+    await run_actor(noop, 'hi', Middleware())
+    errors = [r.exc_info[0] for r in caplog.records if r.exc_info]
+    assert errors == [ValueError]
+
+
+async def test_custom_async__many_failed(caplog: LogCaptureFixture) -> None:
+    triggered: list[str] = []
+
+    class Middleware1(walnats.middlewares.Middleware):
+        async def on_start(self, ctx: walnats.types.Context) -> None:
+            1 / 0
+
+    class Middleware2(walnats.middlewares.Middleware):
+        async def on_start(self, ctx: walnats.types.Context) -> None:
+            raise ValueError
+
+    class Middleware3(walnats.middlewares.Middleware):
+        async def on_start(self, ctx: walnats.types.Context) -> None:
+            await asyncio.sleep(.01)
+            triggered.append('on_start3')
+
+    await run_actor(noop, 'hi', Middleware1(), Middleware2(), Middleware3())
+    assert triggered == ['on_start3']
+    errors = [r.exc_info[0] for r in caplog.records if r.exc_info]
+    assert set(errors) == {ZeroDivisionError, ValueError}
+
+
 async def test_ExtraLogMiddleware(caplog: LogCaptureFixture) -> None:
     caplog.set_level(logging.DEBUG)
     await run_actor(noop, 'hi', walnats.middlewares.ExtraLogMiddleware())
@@ -279,7 +333,7 @@ async def test_StatsdMiddleware(udp_server: UDPLogProtocol) -> None:
     client.flush()
     await asyncio.sleep(.1)
     # remove numbers from `duration` metric, so it can be aggregated
-    hist = [h.split(':0.')[0] for h in udp_server.hist]
+    hist = [re.sub(r'\.duration:.+', '.duration', h) for h in udp_server.hist]
     expected = [
         (r'walnats\..+\..+\.started:1\|c', 40),
         (r'walnats\..+\..+\.failed:1\|c', 20),
@@ -4,6 +4,7 @@ import datetime
 from dataclasses import dataclass
 
 import marshmallow
+import msgspec
 import pydantic
 import pytest
 from cryptography.fernet import Fernet, InvalidToken
@@ -17,6 +18,10 @@ class Pydantic(pydantic.BaseModel):
     value: str
 
 
+class Msgspec(msgspec.Struct):
+    value: str
+
+
 @dataclass
 class Dataclass:
     value: str
@@ -24,6 +29,7 @@ class Dataclass:
 
 TEST_CASES = [
     Pydantic(value='hi'),
+    Msgspec(value='hi'),
     Dataclass(value='hi'),
     Protobuf(value='hello'),
     'hello',
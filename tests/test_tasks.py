@@ -30,6 +30,14 @@ async def test_cancel():
         assert task.cancelled()
 
 
+async def test_stop():
+    t = Tasks('tasks')
+    for _ in range(20):
+        t.start(asyncio.sleep(10), 'task')
+    await t.stop()
+    assert len(t._tasks) == 0
+
+
 @pytest.mark.skipif(CI, reason='the test fails on CI, see PR#2')
 async def test_cleanup_old_cancelled():
     t = Tasks('tasks')
@@ -2,12 +2,15 @@
 from __future__ import annotations
 
 import asyncio
+import math
+import sys
 from dataclasses import dataclass, field
-from datetime import datetime
+from functools import partial
 from logging import getLogger
-from time import perf_counter
+from time import perf_counter, time
 from typing import (
-    TYPE_CHECKING, Awaitable, Callable, Generic, Sequence, TypeVar,
+    TYPE_CHECKING, Any, Awaitable, Callable, Coroutine, Generic, NamedTuple,
+    Optional, Sequence, TypeVar,
 )
 
 import nats.js
@@ -17,22 +20,36 @@ from .._constants import HEADER_DELAY, HEADER_REPLY
 from .._context import Context, ErrorContext, OkContext
 from .._events._event import BaseEvent, EventWithResponse
 from .._tasks import Tasks
-from ._execute_in import ExecuteIn
-from ._priority import Priority
+from ..middlewares import Middleware
+from ._execute_in import ExecuteIn, call_pinned
+from ._priority import Priority, PrioritySemaphore
 
 
 if TYPE_CHECKING:
     from concurrent.futures import Executor
 
-    from ..middlewares import Middleware
-
 
 T = TypeVar('T')
 R = TypeVar('R')
+Hook = Callable[[Any], Optional[Coroutine[None, None, None]]]
 logger = getLogger('walnats.actor')
 
+# The weight of the last poll in the moving average of polled messages.
+BATCH_SMOOTHING = .5
+
+
+# Slots make instances smaller and attribute access faster,
+# but dataclasses support them only since Python 3.10.
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+def _derived() -> Any:
+    """A dataclass field that is calculated in __post_init__ from other fields.
+    """
+    return field(init=False, repr=False, compare=False)
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class Actor(Generic[T, R]):
     """A subscriber group that listens to a specific :class:`walnats.Event`.
 
@@ -85,8 +102,9 @@ class Actor(Generic[T, R]):
     ack_wait: float = 16
     """
     How many seconds to wait from the last update before trying to
-    redeliver the message. Before calling the handler, a task will be started
-    that periodically sends a pulse into Nats saying that the job is in progress.
+    redeliver the message. While messages are being handled, a single task
+    of the actor sends a pulse into Nats every ``ack_wait / 3`` seconds
+    for each of them saying that the job is in progress.
     The pulse, hovewer, might not arrive in Nats if the network or machine dies
     or something has blocked the scheduler for too long.
     """
@@ -121,12 +139,14 @@ class Actor(Generic[T, R]):
     Keep it low for slow handlers, keep it high for highly concurrent handlers.
     """
 
-    job_timeout: float = 32
+    job_timeout: float | None = 32
     """
     How long at most the handler execution can take for a single message.
     If this timeout is reached, asyncio.CancelledError is raised in handler, and
     then all the same things happen as for regular failure: on_failure hooks,
     log message, nak. Doesn't do anything for sync jobs without `execute_in` specified.
+    If None, the handler execution time is not limited, which saves
+    a bit of overhead for very fast handlers.
     """
 
     execute_in: ExecuteIn = ExecuteIn.MAIN
@@ -150,19 +170,36 @@ class Actor(Generic[T, R]):
     """
     Keep sending pulse into Nats JetStream while processing the message.
     The pulse signal makes sure that the message won't be redelivered to another
-    instance of actor while this one is in progress. Disabling the pulse will
+    instance of actor while this one is in progress. Pulses for all messages
+    of the actor are sent by one background task every ``ack_wait / 3`` seconds,
+    and messages handled faster than that don't get any. Disabling the pulse will
     prevent the message being stuck if a handler stucks, but that also means
     the message must be processed faster that `ack_wait`.
     """
 
     priority: Priority = Priority.NORMAL
     """
-    Priority of the actor compared to other actors. Actors with a higher
-    priority have a higher chance to get started earlier. Longer an actor waits
-    its turn, higher its priority gets.
+    Priority of the actor compared to other actors. When the global limit
+    of concurrent jobs is reached, jobs of actors with a higher priority
+    are started first.
     """
 
-    _now: Callable[[], float] = field(default=lambda: datetime.utcnow().timestamp())
+    _now: Callable[[], float] = field(default=time)
+
+    # derived from the fields above in __post_init__
+    _on_start_hooks: tuple[Hook, ...] = _derived()
+    _on_failure_hooks: tuple[Hook, ...] = _derived()
+    _on_success_hooks: tuple[Hook, ...] = _derived()
+    # the key of the handler pinned in process pool workers
+    _pinned_key: str = _derived()
+    # the function to submit into the executor for each message
+    _executor_target: Callable[[T], Awaitable[R] | R] = _derived()
+    # retry_delay as a non-empty tuple
+    _nak_delays: tuple[float, ...] = _derived()
+    _task_names: _TaskNames = _derived()
+    # If the handler is known to return a coroutine. If not known,
+    # the result is checked for every message.
+    _handler_is_async: bool = _derived()
 
     @property
     def consumer_name(self) -> str:
@@ -184,6 +221,23 @@ class Actor(Generic[T, R]):
             max_ack_pending=self.max_ack_pending,
         )
 
+    def __post_init__(self) -> None:
+        # Precompute the state needed for every message.
+        set_attr = object.__setattr__
+        set_attr(self, '_on_start_hooks', _get_hooks(self.middlewares, 'on_start'))
+        set_attr(self, '_on_failure_hooks', _get_hooks(self.middlewares, 'on_failure'))
+        set_attr(self, '_on_success_hooks', _get_hooks(self.middlewares, 'on_success'))
+        set_attr(self, '_pinned_key', f'{self.event.name}/{self.name}')
+        # For process pools, the handler is pinned in every worker when it starts,
+        # so only the key of the handler needs to be pickled for each message.
+        if self.execute_in == ExecuteIn.PROCESS:
+            set_attr(self, '_executor_target', partial(call_pinned, self._pinned_key))
+        else:
+            set_attr(self, '_executor_target', self.handler)
+        set_attr(self, '_nak_delays', tuple(self.retry_delay) or (0,))
+        set_attr(self, '_task_names', _TaskNames.new(self.name))
+        set_attr(self, '_handler_is_async', asyncio.iscoroutinefunction(self.handler))
+
     async def _add(self, js: nats.js.JetStreamContext) -> None:
         """Add Nats consumer.
 
@@ -198,8 +252,9 @@ class Actor(Generic[T, R]):
     async def _listen(
         self, *,
         js: nats.js.JetStreamContext,
-        poll_sem: asyncio.Semaphore,
-        global_sem: asyncio.Semaphore,
+        poll_sem: PrioritySemaphore | _Unlimited,
+        global_sem: PrioritySemaphore,
+        max_jobs: int,
         poll_delay: float,
         burst: bool,
         batch: int,
@@ -215,165 +270,356 @@ class Actor(Generic[T, R]):
             stream=self.event.stream_name,
             pending_msgs_limit=batch,
         )
-        actor_sem = asyncio.Semaphore(self.max_jobs)
+        # If the actor limit is not lower than the global one, the global limit
+        # is always reached first, and so the actor semaphore can be skipped.
+        actor_sem: PrioritySemaphore | _Unlimited
+        if self.max_jobs < max_jobs:
+            actor_sem = PrioritySemaphore(self.max_jobs)
+        else:
+            actor_sem = _Unlimited()
+
+        # A single task sending pulses for all messages in progress.
+        pulser: _Pulser | None = None
+        pulser_task: asyncio.Task[None] | None = None
+        if self.pulse:
+            pulser = _Pulser(self)
+            pulser_task = asyncio.create_task(pulser.run(), name=self._task_names.pulse)
+
+        # A fixed pool of workers handling polled messages. There is no reason
+        # to have more workers than jobs that can run at the same time.
+        queue: asyncio.Queue[Msg | None] = asyncio.Queue()
+        workers: list[asyncio.Task[None]] = []
+        for _ in range(min(self.max_jobs, max_jobs)):
+            worker = asyncio.create_task(
+                self._work(
+                    queue=queue,
+                    global_sem=global_sem,
+                    actor_sem=actor_sem,
+                    pulser=pulser,
+                    tasks=tasks,
+                    executor=executor,
+                ),
+                name=self._task_names.worker,
+            )
+            workers.append(worker)
+
+        # Moving average of how many messages a poll brings. Used to adjust
+        # the batch size: if there are no messages, fetching one message at a time
+        # needs fewer requests to Nats, and if there are many, a bigger batch helps.
+        expected = float(batch)
         try:
             while True:
-                await self._pull_and_handle(
+                received = await self._pull_and_handle(
                     poll_sem=poll_sem,
                     global_sem=global_sem,
                     actor_sem=actor_sem,
                     poll_delay=poll_delay,
-                    batch=batch,
+                    batch=min(batch, max(1, math.ceil(expected * 2))),
                     psub=psub,
-                    tasks=tasks,
-                    executor=executor,
+                    queue=queue,
+                    pulser=pulser,
                 )
+                expected += (received - expected) * BATCH_SMOOTHING
                 if burst:
+                    await queue.join()
                     await tasks.wait()
                     return
         finally:
-            tasks.cancel()
+            for worker in workers:
+                worker.cancel()
+            if pulser_task is not None:
+                pulser_task.cancel()
+            # Messages that no worker picked up will be redelivered after ack_wait.
+            while not queue.empty():
+                queue.get_nowait()
+            # A worker handling a message when cancelled reports the cancellation
+            # as the handler failure and keeps running. Make sure it stops.
+            for _ in workers:
+                queue.put_nowait(None)
+            # Let the workers finish nak'ing the interrupted messages
+            # before the subscription is gone.
+            stopping = workers if pulser_task is None else [*workers, pulser_task]
+            await asyncio.gather(*stopping, return_exceptions=True)
+            # Stopped workers might have started on_failure hooks, stop them as well.
+            await tasks.stop()
             await psub.unsubscribe()
 
     async def _pull_and_handle(
         self, *,
-        poll_sem: asyncio.Semaphore,
-        global_sem: asyncio.Semaphore,
-        actor_sem: asyncio.Semaphore,
+        poll_sem: PrioritySemaphore | _Unlimited,
+        global_sem: PrioritySemaphore,
+        actor_sem: PrioritySemaphore | _Unlimited,
         poll_delay: float,
         batch: int,
         psub: nats.js.JetStreamContext.PullSubscription,
-        tasks: Tasks,
-        executor: Executor | None,
-    ) -> None:
+        queue: asyncio.Queue[Msg | None],
+        pulser: _Pulser | None,
+    ) -> int:
+        """Poll messages and put them into the queue.
+
+        Returns the number of polled messages.
+        """
         # don't try polling new messages if there are no jobs to handle them
-        if actor_sem.locked():
-            await actor_sem.acquire()
-            actor_sem.release()
-        if global_sem.locked():
-            await global_sem.acquire()
-            global_sem.release()
+        await actor_sem.wait_available()
+        await global_sem.wait_available(self.priority.value)
 
         # poll messages
         async with poll_sem:
             try:
                 msgs = await psub.fetch(batch=batch, timeout=poll_delay)
             except asyncio.TimeoutError:
-                return
+                return 0
 
-        # run jobs
+        # schedule jobs
         for msg in msgs:
-            tasks.start(self._handle_message(
-                msg=msg,
-                global_sem=global_sem,
-                actor_sem=actor_sem,
-                tasks=tasks,
-                executor=executor,
-            ), name=f'actors/{self.name}/handle_message')
+            # if the message should be delayed, nak it with the delay and skip the message
+            headers = msg.headers
+            delay_str = headers.get(HEADER_DELAY) if headers else None
+            if delay_str:
+                delayed_until = float(delay_str)
+                delay_left = delayed_until - self._now()
+                if delay_left > .001:
+                    await msg.nak(delay=delay_left)
+                    continue
+
+            # The pulse is started right away because the message
+            # might wait in the queue until a worker is free.
+            if pulser is not None:
+                pulser.add(msg)
+            queue.put_nowait(msg)
+        return len(msgs)
+
+    async def _work(
+        self, *,
+        queue: asyncio.Queue[Msg | None],
+        global_sem: PrioritySemaphore,
+        actor_sem: PrioritySemaphore | _Unlimited,
+        pulser: _Pulser | None,
+        tasks: Tasks,
+        executor: Executor | None,
+    ) -> None:
+        """Handle messages from the queue one at a time.
+        """
+        while True:
+            msg = await queue.get()
+            if msg is None:
+                return
+            # There are as many workers as the actor can run jobs, so there is
+            # always a free slot. It is taken only to let the poller know
+            # when all workers are busy.
+            actor_sem.acquire_nowait()
+            try:
+                await self._handle_message(msg, pulser, global_sem, tasks, executor)
+            except Exception:
+                logger.exception('Failed to handle message in "%s" actor', self.name)
+            finally:
+                actor_sem.release()
+                queue.task_done()
 
     async def _handle_message(
         self,
         msg: Msg,
-        global_sem: asyncio.Semaphore,
-        actor_sem: asyncio.Semaphore,
+        pulser: _Pulser | None,
+        global_sem: PrioritySemaphore,
         tasks: Tasks,
         executor: Executor | None,
     ) -> None:
-        prefix = f'actors/{self.name}/'
-        if msg.metadata.sequence:
-            prefix += f'{msg.metadata.sequence.stream}/'
-
-        # if the message should be delayed, nak it with the delay and skip the message
-        delay_str = (msg.headers or {}).get(HEADER_DELAY)
-        if delay_str:
-            delayed_until = float(delay_str)
-            delay_left = delayed_until - self._now()
-            if delay_left > .001:
-                await msg.nak(delay=delay_left)
-                return
-
-        pulse_task: asyncio.Task[None] | None = None
-        if self.pulse:
-            pulse_task = asyncio.create_task(
-                self._pulse(msg),
-                name=f'{prefix}pulse',
-            )
         event = None
         try:
-            async with actor_sem, self.priority.acquire(global_sem):
-                start = perf_counter()
+            async with self.priority.acquire(global_sem):
+                # the duration is used only by on_success hooks
+                start = perf_counter() if self._on_success_hooks else 0.
                 event = self.event.decode(msg.data)
 
                 # trigger on_start hooks
-                if self.middlewares:
+                if self._on_start_hooks:
                     ctx = Context(actor=self, message=event, _msg=msg)
-                    for mw in self.middlewares:
-                        coro = mw.on_start(ctx)
-                        if coro is not None:
-                            tasks.start(coro, name=f'{prefix}on_start')
+                    name = self._task_names.on_start
+                    _run_hooks(tasks, self._on_start_hooks, ctx, name)
 
                 if executor is not None:
                     loop = asyncio.get_running_loop()
-                    result = await asyncio.wait_for(
-                        loop.run_in_executor(executor, self.handler, event),
-                        timeout=self.job_timeout,
+                    result = await self._with_timeout(
+                        loop.run_in_executor(executor, self._executor_target, event),
                     )
                 else:
                     result = self.handler(event)
-                    if asyncio.iscoroutine(result):
-                        result = await asyncio.wait_for(
-                            result,
-                            timeout=self.job_timeout,
+                    if self._handler_is_async or asyncio.iscoroutine(result):
+                        result = await self._with_timeout(
+                            result,  # type: ignore[arg-type]
                         )
         except (Exception, asyncio.CancelledError) as exc:
-            if pulse_task is not None:
-                pulse_task.cancel()
-            logger.exception(f'Unhandled {type(exc).__name__} in "{self.name}" actor')
-            nak_coro = msg.nak(delay=self._get_nak_delay(msg.metadata.num_delivered))
-            tasks.start(nak_coro, name=f'{prefix}nak')
+            if pulser is not None:
+                pulser.remove(msg)
+            logger.exception('Unhandled %s in "%s" actor', type(exc).__name__, self.name)
+            # Like ack, nak only appends to the client's pending buffer,
+            # the network write is done by the client's flusher.
+            await msg.nak(delay=self._get_nak_delay(msg.metadata.num_delivered))
 
             # trigger on_failure hooks
-            if self.middlewares:
+            if self._on_failure_hooks:
                 ectx = ErrorContext(actor=self, message=event, exception=exc, _msg=msg)
-                for mw in self.middlewares:
-                    coro = mw.on_failure(ectx)
-                    if coro is not None:
-                        tasks.start(coro, name=f'{prefix}on_failure')
+                name = self._task_names.on_failure
+                _run_hooks(tasks, self._on_failure_hooks, ectx, name)
         else:
-            if pulse_task is not None:
-                pulse_task.cancel()
+            if pulser is not None:
+                pulser.remove(msg)
             await msg.ack()
 
             if isinstance(self.event, EventWithResponse):
                 payload = self.event.encode_response(result)
-                reply = msg.headers.get(HEADER_REPLY) if msg.headers else None
+                headers = msg.headers
+                reply = headers.get(HEADER_REPLY) if headers else None
                 if reply is not None:
-                    coro = msg._client.publish(reply, payload, headers=msg.headers)
-                    tasks.start(coro, name=f'{prefix}respond')
+                    coro = msg._client.publish(reply, payload, headers=headers)
+                    tasks.start(coro, name=self._task_names.respond)
 
             # trigger on_success hooks
-            if self.middlewares:
+            if self._on_success_hooks:
                 duration = perf_counter() - start
                 octx = OkContext(actor=self, message=event, _msg=msg, duration=duration)
-                for mw in self.middlewares:
-                    coro = mw.on_success(octx)
-                    if coro is not None:
-                        tasks.start(coro, name=f'{prefix}on_success')
+                name = self._task_names.on_success
+                _run_hooks(tasks, self._on_success_hooks, octx, name)
 
-    async def _pulse(self, msg: Msg) -> None:
-        """Keep notifying nats server that the message handling is in progress.
+    def _with_timeout(self, aw: Awaitable[Any]) -> Awaitable[Any]:
+        """Limit the time the handler can run, if the limit is set.
         """
-        while True:
-            await asyncio.sleep(self.ack_wait / 2)
-            await msg.in_progress()
+        if self.job_timeout is None:
+            return aw
+        return _wait_for(aw, timeout=self.job_timeout)
 
     def _get_nak_delay(self, attempt: int | None) -> float:
-        delays = self.retry_delay
-        if not delays:
-            return 0
-        if attempt is None:
-            return delays[0]
-        assert attempt >= 0
-        if attempt >= len(delays):
-            return delays[-1]
-        return delays[attempt]
+        delays = self._nak_delays
+        return delays[min(attempt or 0, len(delays) - 1)]
+
+
+class _TaskNames(NamedTuple):
+    """Names of tasks started by an actor.
+    """
+    worker: str
+    pulse: str
+    on_start: str
+    on_failure: str
+    on_success: str
+    respond: str
+
+    @classmethod
+    def new(cls, actor_name: str) -> _TaskNames:
+        prefix = f'actors/{actor_name}/'
+        return cls(*(prefix + field for field in cls._fields))
+
+
+class _Pulser:
+    """Keep notifying nats server that handling of the messages is in progress.
+
+    A single loop sends pulses for all messages of the actor. Each message gets
+    the first pulse after it has been in progress for at least one interval,
+    so jobs that finish fast don't produce any pulses.
+    """
+    __slots__ = ('_actor', '_new', '_old')
+
+    def __init__(self, actor: Actor) -> None:
+        self._actor = actor
+        # messages added after the last iteration of the loop
+        self._new: dict[int, Msg] = {}
+        # messages that were already in progress at the last iteration
+        self._old: dict[int, Msg] = {}
+
+    def add(self, msg: Msg) -> None:
+        self._new[id(msg)] = msg
+
+    def remove(self, msg: Msg) -> None:
+        self._new.pop(id(msg), None)
+        self._old.pop(id(msg), None)
+
+    async def run(self) -> None:
+        # A message waits at most two intervals for its first pulse.
+        interval = self._actor.ack_wait / 3
+        while True:
+            await asyncio.sleep(interval)
+            for msg in list(self._old.values()):
+                try:
+                    await msg.in_progress()
+                except Exception:
+                    logger.exception(
+                        'Failed to send pulse in "%s" actor', self._actor.name,
+                    )
+            self._old.update(self._new)
+            self._new = {}
+
+
+class _Unlimited:
+    """A no-op replacement for a semaphore that can never be locked.
+    """
+    __slots__ = ()
+
+    def locked(self) -> bool:
+        return False
+
+    async def wait_available(self) -> None:
+        pass
+
+    def acquire_nowait(self) -> None:
+        pass
+
+    def release(self) -> None:
+        pass
+
+    async def __aenter__(self) -> None:
+        pass
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        pass
+
+
+if sys.version_info >= (3, 11):
+    async def _wait_for(aw: Awaitable[Any], timeout: float) -> Any:
+        """Like asyncio.wait_for but doesn't wrap the awaitable into a task.
+
+        Instead, the timeout cancels the current task.
+        """
+        async with asyncio.timeout(timeout):
+            return await aw
+else:
+    from asyncio import wait_for as _wait_for
+
+
+def _get_hooks(middlewares: tuple[Middleware, ...], hook: str) -> tuple[Hook, ...]:
+    """Get the given hook of middlewares that override the no-op hook of the base class.
+    """
+    default = getattr(Middleware, hook)
+    return tuple(
+        getattr(mw, hook) for mw in middlewares
+        if getattr(type(mw), hook) is not default
+    )
+
+
+def _run_hooks(tasks: Tasks, hooks: tuple[Hook, ...], ctx: Any, name: str) -> None:
+    """Call the hooks and run async ones in the background, all in a single task.
+    """
+    coros = []
+    for hook in hooks:
+        coro = hook(ctx)
+        if coro is not None:
+            coros.append(coro)
+    if coros:
+        tasks.start(_run_async_hooks(coros, name), name=name)
+
+
+async def _run_async_hooks(coros: list[Coroutine[None, None, None]], name: str) -> None:
+    """Run the hooks concurrently and log their failures.
+
+    A failed hook doesn't cancel the other ones and doesn't fail the actor,
+    no matter how many hooks there are.
+    """
+    if len(coros) == 1:
+        # a single hook doesn't need to be wrapped into a task by gather
+        try:
+            await coros[0]
+        except Exception:
+            logger.exception('Failed to run middleware hook in "%s"', name)
+        return
+    results = await asyncio.gather(*coros, return_exceptions=True)
+    for result in results:
+        if isinstance(result, Exception):
+            logger.error('Failed to run middleware hook in "%s"', name, exc_info=result)
@@ -10,8 +10,13 @@ from dataclasses import dataclass
 import nats
 import nats.js
 
-from ._actor import Actor
-from ._execute_in import ExecuteIn
+from ._actor import Actor, _Unlimited
+from ._execute_in import ExecuteIn, pin_handlers
+from ._priority import PrioritySemaphore
+
+
+# How many requests to add consumers can be sent to Nats JetStream at once.
+MAX_REGISTER_REQUESTS = 32
 
 
 @dataclass(frozen=True)
@@ -40,12 +45,15 @@ class ConnectedActors:
             async with actors.connect() as conn:
                 await conn.register()
         """
+        sem = asyncio.Semaphore(MAX_REGISTER_REQUESTS)
+
+        async def add(actor: Actor) -> None:
+            async with sem:
+                await actor._add(self._js)
+
         tasks = []
         for actor in self._actors:
-            task = asyncio.create_task(
-                actor._add(self._js),
-                name=f'actors/{actor.name}/add',
-            )
+            task = asyncio.create_task(add(actor), name=f'actors/{actor.name}/add')
             tasks.append(task)
         await asyncio.gather(*tasks)
 
@@ -95,15 +103,27 @@ class ConnectedActors:
         assert max_processes is None or max_processes >= 1
         assert max_threads is None or max_threads >= 1
 
-        poll_sem = asyncio.Semaphore(max_polls or len(self._actors))
-        global_sem = asyncio.Semaphore(max_jobs)
+        # Each actor has at most one active poll request, so the limit is needed
+        # only if it is lower than the number of actors.
+        poll_sem: PrioritySemaphore | _Unlimited = _Unlimited()
+        if max_polls is not None and max_polls < len(self._actors):
+            poll_sem = PrioritySemaphore(max_polls)
+        global_sem = PrioritySemaphore(max_jobs)
         thread_pool: ThreadPoolExecutor | None = None
         proc_pool: ProcessPoolExecutor | None = None
         with ExitStack() as stack:
             if any(a.execute_in == ExecuteIn.THREAD for a in self._actors):
                 thread_pool = stack.enter_context(ThreadPoolExecutor(max_threads))
-            if any(a.execute_in == ExecuteIn.PROCESS for a in self._actors):
-                proc_pool = stack.enter_context(ProcessPoolExecutor(max_processes))
+            pinned = {
+                a._pinned_key: a.handler for a in self._actors
+                if a.execute_in == ExecuteIn.PROCESS
+            }
+            if pinned:
+                proc_pool = stack.enter_context(ProcessPoolExecutor(
+                    max_processes,
+                    initializer=pin_handlers,
+                    initargs=(pinned,),
+                ))
             tasks: list[asyncio.Task] = []
             executor: Executor | None
             for actor in self._actors:
@@ -118,6 +138,7 @@ class ConnectedActors:
                     burst=burst,
                     poll_sem=poll_sem,
                     global_sem=global_sem,
+                    max_jobs=max_jobs,
                     batch=batch,
                     poll_delay=poll_delay,
                     executor=executor,
@@ -1,6 +1,12 @@
 from __future__ import annotations
 
 from enum import Enum
+from typing import Any, Callable, Mapping
+
+
+# Handlers of actors running in a process pool,
+# pinned in each worker process when the worker starts.
+_pinned: dict[str, Callable[[Any], Any]] = {}
 
 
 class ExecuteIn(Enum):
@@ -43,3 +49,18 @@ class ExecuteIn(Enum):
     The number of threads can be configured with ``max_processes`` argument
     of :meth:`walnats.types.ConnectedActors.listen`.
     """
+
+
+def pin_handlers(handlers: Mapping[str, Callable[[Any], Any]]) -> None:
+    """Remember handlers in the current worker process.
+
+    Used as the initializer for the process pool, so that handlers are pickled
+    and sent into the worker only once instead of for every message.
+    """
+    _pinned.update(handlers)
+
+
+def call_pinned(key: str, event: Any) -> Any:
+    """Call the handler pinned in the current worker process by ``pin_handlers``.
+    """
+    return _pinned[key](event)
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
 from contextlib import asynccontextmanager
 from enum import Enum
+from itertools import count
 from typing import AsyncIterator
 
 
@@ -32,11 +34,82 @@ class Priority(Enum):
     """Start if there are no HIGH or NORMAL priority actors."""
 
     @asynccontextmanager
-    async def acquire(self, sem: asyncio.Semaphore) -> AsyncIterator[None]:
+    async def acquire(self, sem: PrioritySemaphore) -> AsyncIterator[None]:
         """Acquire semaphore with priority.
         """
-        for _ in range(self.value):
-            async with sem:
-                await asyncio.sleep(0)
-        async with sem:
+        await sem.acquire(self.value)
+        try:
             yield
+        finally:
+            sem.release()
+
+
+class PrioritySemaphore:
+    """Semaphore that wakes up waiters with the lowest priority value first.
+
+    Waiters with the same priority are woken up in the order they came.
+    A released slot is handed over directly to the next waiter, so releasing
+    many slots at once wakes up as many waiters in the same loop iteration,
+    and a newcomer cannot take the slot from a woken up waiter.
+    When used as a context manager, the default priority is used.
+    """
+    __slots__ = ('_value', '_waiters', '_seq')
+
+    def __init__(self, value: int) -> None:
+        self._value = value
+        # (priority, arrival order, future, if the waiter takes the slot)
+        self._waiters: list[tuple[int, int, asyncio.Future[None], bool]] = []
+        self._seq = count()
+
+    def locked(self) -> bool:
+        return self._value == 0
+
+    async def acquire(self, priority: int = 0) -> None:
+        # The value is positive only when there are no waiters.
+        if self._value > 0:
+            self._value -= 1
+            return
+        fut = self._wait(priority, take=True)
+        try:
+            await fut
+        except asyncio.CancelledError:
+            # the slot was handed over right before the cancellation, pass it on
+            if fut.done() and not fut.cancelled():
+                self.release()
+            raise
+
+    def acquire_nowait(self) -> None:
+        """Acquire a slot that is known to be free.
+        """
+        assert self._value > 0
+        self._value -= 1
+
+    async def wait_available(self, priority: int = 0) -> None:
+        """Wait until a waiter with the given priority could get a slot.
+
+        The slot is not acquired.
+        """
+        if self._value > 0:
+            return
+        await self._wait(priority, take=False)
+
+    def release(self) -> None:
+        while self._waiters:
+            _, _, fut, take = heapq.heappop(self._waiters)
+            if fut.done():
+                continue
+            fut.set_result(None)
+            if take:
+                return
+        self._value += 1
+
+    def _wait(self, priority: int, take: bool) -> asyncio.Future[None]:
+        fut = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._seq), fut, take))
+        return fut
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self.release()
@@ -22,20 +22,23 @@ class Actors:
         async with actors.connect() as conn:
             ...
     """
-    __slots__ = ['_actors']
+    __slots__ = ['_actors', '_by_name']
     _actors: tuple[Actor, ...]
+    _by_name: dict[str, Actor]
 
     def __init__(self, *actors: Actor) -> None:
         assert actors
         self._actors = actors
+        # Actors of different events may have the same name,
+        # the first one is returned by get.
+        self._by_name = {}
+        for actor in actors:
+            self._by_name.setdefault(actor.name, actor)
 
     def get(self, name: str) -> Actor | None:
         """Get an :class:`walnats.Actor` from the list of registered actors by name.
         """
-        for actor in self._actors:
-            if actor.name == name:
-                return actor
-        return None
+        return self._by_name.get(name)
 
     def __iter__(self) -> Iterator[Actor]:
         """Iterate over all registered actors.
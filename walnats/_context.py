@@ -15,6 +15,27 @@ if TYPE_CHECKING:
     from ._actors import Actor
 
 
+if TYPE_CHECKING:
+    from functools import cached_property as _cached_property
+else:
+    class _cached_property(cached_property):
+        """Like functools.cached_property but without the lock.
+
+        Before Python 3.12, functools.cached_property acquires a lock on every
+        first access. Contexts are used only from the event loop thread,
+        so the lock is never needed.
+        """
+
+        def __get__(self, instance, owner=None):
+            if instance is None:
+                return self
+            value = self.func(instance)
+            # The descriptor has no __set__, so the cached value in the instance
+            # __dict__ is found before the descriptor on the next access.
+            instance.__dict__[self.attrname] = value
+            return value
+
+
 @dataclass(frozen=True)
 class BaseContext:
 
@@ -27,20 +48,20 @@ class BaseContext:
 
     _msg: Msg
 
-    @cached_property
+    @_cached_property
     def metadata(self) -> Msg.Metadata:
         """Message metadata provided by Nats.
         """
         return self._msg.metadata
 
-    @cached_property
+    @_cached_property
     def seq_number(self) -> int:
         """Sequence ID of the message in Nats JetStream.
         """
         seq = self.metadata.sequence
         return seq.stream if seq else 0
 
-    @cached_property
+    @_cached_property
     def attempts(self) -> int:
         """The number of times the message was tried to be delivered.
 
@@ -54,20 +75,21 @@ class BaseContext:
         """
         attempts = self.metadata.num_delivered or 1
         if attempts >= 2:
-            delayed = (self._msg.headers or {}).get(HEADER_DELAY)
-            if delayed:
+            headers = self._msg.headers
+            if headers and headers.get(HEADER_DELAY):
                 return attempts - 1
         return attempts
 
-    @cached_property
+    @_cached_property
     def trace_id(self) -> str | None:
         """The ``trace_id`` provided when emitting the message.
 
         This value is typically used for distributed tracing.
         """
-        if self._msg.headers is None:
+        headers = self._msg.headers
+        if headers is None:
             return None
-        return self._msg.headers.get(HEADER_TRACE)
+        return headers.get(HEADER_TRACE)
 
 
 @dataclass(frozen=True)
@@ -78,10 +78,11 @@ class Clock:
         """
         tasks = Tasks(f'clock/{self.event.name}')
         try:
+            tick = 0
             while True:
-                await self._wait()
-                now = datetime.now()
-                coro = self._emit(conn, now)
+                tick = await self._wait(tick)
+                now = self._now()
+                coro = self._emit(conn, now, tick)
                 tasks.start(coro, f'clock/{self.event}/tick/{now.minute}')
                 if burst:
                     await tasks.wait()
@@ -89,17 +90,30 @@ class Clock:
         finally:
             tasks.cancel()
 
-    async def _wait(self) -> None:
+    async def _wait(self, last_tick: int = 0) -> int:
         """Wait until the next minute +ε.
+
+        Returns the number of the tick (the number of periods since the epoch).
+        It is the same for all clocks waiting for the same tick, and so it is used
+        as the message ID to deduplicate events emitted by multiple clocks.
+
+        The tick is always after the ``last_tick``. If the loop was blocked
+        for longer than the period, the missed ticks are skipped.
         """
         now = self._now().timestamp()
-        delay = self.period - (now % self.period) + .001
-        await asyncio.sleep(delay)
+        tick = max(int(now // self.period), last_tick) + 1
+        deadline = tick * self.period
+        # The loop sleeps by the monotonic clock, and so it may wake up
+        # a bit before the wall clock reaches the deadline.
+        while now < deadline:
+            await asyncio.sleep(deadline - now + .001)
+            now = self._now().timestamp()
+        return tick
 
     async def _emit(
         self,
         conn: walnats.types.ConnectedEvents,
         now: datetime,
+        tick: int,
     ) -> None:
-        uid = now.timestamp() % self.period
-        await conn.emit(self.event, now, uid=f'{uid}', meta=self.meta)
+        await conn.emit(self.event, now, uid=f'{tick}', meta=self.meta)
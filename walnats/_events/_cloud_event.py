@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass, fields
 from datetime import datetime
 
 
@@ -33,7 +33,11 @@ class CloudEvent:
     def as_dict(self) -> dict[str, str | int]:
         """Represent the metadata as a JSON-friendly dict.
         """
-        result = {k: v for k, v in asdict(self).items() if v is not None}
+        result: dict[str, str | int] = {}
+        for name, _ in _FIELDS:
+            value = getattr(self, name)
+            if value is not None:
+                result[name] = value
         if self.time is not None:
             result['time'] = f'{self.time.isoformat()}Z'
         return result
@@ -46,4 +50,19 @@ class CloudEvent:
 
         The spec: https://github.com/cloudevents/spec/blob/main/cloudevents/bindings/nats-protocol-binding.md
         """  # noqa: E501
-        return {f'ce-{k}': str(v) for k, v in self.as_dict().items()}
+        result: dict[str, str] = {}
+        for name, header in _FIELDS:
+            value = getattr(self, name)
+            if value is not None:
+                result[header] = str(value)
+        if self.time is not None:
+            result['ce-time'] = f'{self.time.isoformat()}Z'
+        return result
+
+
+# Names of the fields and of the matching Nats headers.
+# Unlike dataclasses.asdict, reading fields by name doesn't deep-copy the values.
+# The time is formatted separately, so it's not included.
+_FIELDS = tuple(
+    (f.name, f'ce-{f.name}') for f in fields(CloudEvent) if f.name != 'time'
+)
@@ -3,7 +3,7 @@ from __future__ import annotations
 import asyncio
 import dataclasses
 from functools import cached_property
-from typing import Generic, TypeVar
+from typing import TYPE_CHECKING, Generic, TypeVar
 
 import nats
 import nats.js
@@ -14,6 +14,10 @@ from ..serializers import Serializer, get_serializer
 from ._limits import Limits
 
 
+if TYPE_CHECKING:
+    from nats.aio.msg import Msg
+
+
 T = TypeVar('T')
 R = TypeVar('R')
 
@@ -54,13 +58,13 @@ class BaseEvent(Generic[T, R]):
     Limits for messages in the Nats stream (like size, age, number).
     """
 
-    @property
+    @cached_property
     def subject_name(self) -> str:
         """The name of Nats subject used to emit messages.
         """
         return self.name
 
-    @property
+    @cached_property
     def stream_name(self) -> str:
         """The name of Nats JetStream stream used to provide message persistency.
 
@@ -89,7 +93,7 @@ class BaseEvent(Generic[T, R]):
             return self.serializer
         return get_serializer(self.schema)
 
-    @property
+    @cached_property
     def _stream_config(self) -> nats.js.api.StreamConfig:
         """Configuration for Nats JetStream stream.
 
@@ -130,12 +134,22 @@ class BaseEvent(Generic[T, R]):
 
     async def _monitor(self, nc: nats.NATS, queue: asyncio.Queue[T]) -> None:
         """Subscribe to the subject and emit all events into the given queue.
+
+        Runs until cancelled.
         """
-        sub = await nc.subscribe(self.subject_name)
-        print(sub)
-        async for msg in sub.messages:
-            event = self.decode(msg.data)
-            await queue.put(event)
+        decode = self._serializer.decode
+        # the queue is unbounded, so putting never blocks
+        put_nowait = queue.put_nowait
+
+        async def put(msg: Msg) -> None:
+            put_nowait(decode(msg.data))
+
+        sub = await nc.subscribe(self.subject_name, cb=put)
+        try:
+            await asyncio.Future()
+        finally:
+            if not nc.is_closed:
+                await sub.unsubscribe()
 
 
 @dataclasses.dataclass(frozen=True)
@@ -22,20 +22,23 @@ class Events:
         async with events.connect() as conn:
             ...
     """
-    __slots__ = ('_events',)
+    __slots__ = ('_events', '_by_name')
     _events: tuple[BaseEvent, ...]
+    _by_name: dict[str, BaseEvent]
 
     def __init__(self, *events: BaseEvent) -> None:
         assert events
         self._events = events
+        # Events may have the same name (like an event and its copy
+        # with a response), the first one is returned by get.
+        self._by_name = {}
+        for event in events:
+            self._by_name.setdefault(event.name, event)
 
     def get(self, name: str) -> BaseEvent | None:
         """Get an :class:`walnats.Event` from the list of registered events by name.
         """
-        for event in self._events:
-            if event.name == name:
-                return event
-        return None
+        return self._by_name.get(name)
 
     def __iter__(self) -> Iterator[BaseEvent]:
         """Iterate over all registered events.
@@ -64,7 +67,11 @@ class Events:
         assert not connection.is_closed
         try:
             js = connection.jetstream()
-            yield ConnectedEvents(connection, js, self._events)
+            conn = ConnectedEvents(connection, js, self._events, self._by_name)
+            try:
+                yield conn
+            finally:
+                await conn._replies.close(connection)
         finally:
             if close:
                 await connection.close()
@@ -34,6 +34,12 @@ class Tasks:
         for task in self._tasks:
             task.cancel()
 
+    async def stop(self) -> None:
+        """Cancel all supervised tasks and wait for them to finish.
+        """
+        self.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
     async def wait(self) -> None:
         """Wait for all supervised tasks to finish.
         """
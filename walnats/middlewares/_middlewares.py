@@ -90,15 +90,16 @@ class TextLogMiddleware(Middleware):
     def on_start(self, ctx: Context) -> None:
         a = ctx.actor
         attempt = ctx.attempts
-        msg = f'event {a.event.name}: received by {a.name}'
         if attempt:
-            msg += ' (attempt #{attempt})'
-        self.logger.debug(msg)
+            msg = 'event %s: received by %s (attempt #%s)'
+            self.logger.debug(msg, a.event.name, a.name, attempt)
+        else:
+            self.logger.debug('event %s: received by %s', a.event.name, a.name)
 
     def on_failure(self, ctx: ErrorContext) -> None:
         a = ctx.actor
-        self.logger.exception(f'event {a.event.name}: actor {a.name} failed')
+        self.logger.exception('event %s: actor %s failed', a.event.name, a.name)
 
     def on_success(self, ctx: OkContext) -> None:
         a = ctx.actor
-        self.logger.debug(f'event {a.event.name}: processed by {a.name}')
+        self.logger.debug('event %s: processed by %s', a.event.name, a.name)
@@ -3,8 +3,8 @@ from ._optional import MessagePackSerializer
 from ._registry import get_serializer
 from ._serializers import (
     BytesSerializer, DataclassSerializer, DatetimeSerializer,
-    MarshmallowSerializer, PrimitiveSerializer, ProtobufSerializer,
-    PydanticSerializer,
+    MarshmallowSerializer, MsgspecSerializer, PrimitiveSerializer,
+    ProtobufSerializer, PydanticSerializer,
 )
 from ._wrappers import FernetSerializer, GZipSerializer, HMACSerializer
 
@@ -19,6 +19,7 @@ __all__ = [
     'DatetimeSerializer',
     'MarshmallowSerializer',
     'MessagePackSerializer',
+    'MsgspecSerializer',
     'PrimitiveSerializer',
     'ProtobufSerializer',
     'PydanticSerializer',
@@ -8,6 +8,7 @@ from ._base import Serializer
 
 SERIALIZERS: tuple[type[Serializer], ...] = (
     ss.PydanticSerializer,
+    ss.MsgspecSerializer,
     ss.ProtobufSerializer,
     ss.DataclassSerializer,
     ss.BytesSerializer,
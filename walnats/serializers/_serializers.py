@@ -3,6 +3,7 @@ from __future__ import annotations
 import dataclasses
 import datetime
 import json
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from ._base import Serializer
@@ -12,6 +13,9 @@ try:
     import pydantic
 except ImportError:
     pydantic = None  # type: ignore[assignment]
+    PYDANTIC_V1 = False
+else:
+    PYDANTIC_V1 = pydantic.VERSION.startswith('1.')
 
 try:
     import google.protobuf.message as protobuf
@@ -23,10 +27,16 @@ try:
 except ImportError:
     marshmallow = None  # type: ignore[assignment]
 
+try:
+    import msgspec
+except ImportError:
+    msgspec = None  # type: ignore[assignment]
+
 
 if TYPE_CHECKING:
     from google.protobuf.message import Message as ProtobufMessage
     from marshmallow import Schema as MarshmallowSchema
+    from msgspec import Struct
     from pydantic import BaseModel
 
 
@@ -45,10 +55,49 @@ class PydanticSerializer(Serializer['BaseModel']):
         return cls(schema)
 
     def encode(self, message: BaseModel) -> bytes:
-        return message.json(separators=(',', ':')).encode(encoding='utf8')
+        if PYDANTIC_V1:
+            text = message.json(separators=(',', ':'))
+        else:
+            # pydantic_core serializes straight into compact JSON
+            text = message.model_dump_json()  # type: ignore[attr-defined,unused-ignore]
+        return text.encode(encoding='utf8')
 
     def decode(self, data: bytes) -> BaseModel:
-        return self.schema.parse_raw(data)
+        if PYDANTIC_V1:
+            return self.schema.parse_raw(data)
+        model = self.schema
+        # parse and validate raw bytes in one pass, without decoding to str
+        return model.model_validate_json(data)  # type: ignore[attr-defined,unused-ignore]
+
+
+@dataclasses.dataclass(frozen=True)
+class MsgspecSerializer(Serializer['Struct']):
+    """Serialize msgspec structs as JSON.
+
+    The payload is parsed and validated in a single pass straight from bytes,
+    which makes it the fastest option for typed JSON messages.
+
+    Requires ``msgspec`` package to be installed.
+    """
+    schema: type[Struct]
+
+    @classmethod
+    def new(cls, schema: type[object]) -> MsgspecSerializer | None:
+        if msgspec is None:
+            return None
+        if not issubclass(schema, msgspec.Struct):
+            return None
+        return cls(schema)
+
+    @cached_property
+    def _decoder(self) -> msgspec.json.Decoder[Struct]:
+        return msgspec.json.Decoder(self.schema)
+
+    def encode(self, message: Struct) -> bytes:
+        return msgspec.json.encode(message)
+
+    def decode(self, data: bytes) -> Struct:
+        return self._decoder.decode(data)
 
 
 @dataclasses.dataclass(frozen=True)